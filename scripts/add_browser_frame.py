@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pillow"]
+# dependencies = ["numpy", "pillow"]
 # ///
 """Add macOS-style browser frames to screenshots.
 
@@ -9,33 +9,50 @@ Usage:
     uv run scripts/add_browser_frame.py input.png -o output.png
     uv run scripts/add_browser_frame.py input_dir/ -o output_dir/
     uv run scripts/add_browser_frame.py input.png --title "Antelope Cloud" --shadow
+    uv run --with pyoxipng scripts/add_browser_frame.py input.png -o out.png --optimize
 """
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import numpy as np
 import argparse
+import functools
+import os
 import sys
 
+try:
+    import oxipng  # Optional: only needed for --optimize
+except ImportError:
+    oxipng = None
+
 # Frame styling constants
 TITLE_BAR_HEIGHT = 32
 BUTTON_RADIUS = 6
 BUTTON_SPACING = 8
 BUTTON_LEFT_MARGIN = 12
-BUTTON_COLORS = ["#ff5f57", "#febc2e", "#28c840"]  # Close, minimize, maximize
+BUTTON_COLORS_RGB = [  # Close, minimize, maximize
+    (0xFF, 0x5F, 0x57),  # #ff5f57
+    (0xFE, 0xBC, 0x2E),  # #febc2e
+    (0x28, 0xC8, 0x40),  # #28c840
+]
 TITLE_BAR_COLOR = (232, 232, 232)  # #e8e8e8
+TITLE_BAR_FILL = TITLE_BAR_COLOR + (255,)
 BORDER_COLOR = (200, 200, 200)  # Light gray border
 CORNER_RADIUS = 10
 SHADOW_OFFSET = 4
 SHADOW_BLUR = 12
 SHADOW_COLOR = (0, 0, 0, 80)  # Semi-transparent black
 PADDING = 20  # Padding around the framed image for shadow
-SUPERSAMPLE_SCALE = 3  # Render at 3x for anti-aliasing, then downscale
-
-
-def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+SUPERSAMPLE_SCALE = 3  # Render AA sprites at 3x, then downscale
+TITLE_FONT_PATHS = (
+    "/System/Library/Fonts/SF-Pro-Text-Medium.otf",
+    "/System/Library/Fonts/Helvetica.ttc",
+)
+TITLE_FONT_SIZE = 13
+PNG_COMPRESS_LEVEL = 1  # zlib level; output is usually post-processed, favour speed
+OXIPNG_LEVEL = 2  # oxipng preset used by --optimize
 
 
 def draw_rounded_rectangle(
@@ -51,106 +68,158 @@ def draw_rounded_rectangle(
     draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=width)
 
 
+def require_oxipng() -> None:
+    """Raise a clear error if pyoxipng, needed for PNG optimization, is missing."""
+    if oxipng is None:
+        raise RuntimeError(
+            "PNG optimization requires pyoxipng "
+            "(e.g. uv run --with pyoxipng scripts/add_browser_frame.py ...)"
+        )
+
+
+def blur_step(length: int, start: int, end: int, sigma: float) -> np.ndarray:
+    """Gaussian-blur a 1D step that is 1 on [start, end) and 0 elsewhere."""
+    radius = int(4 * sigma + 0.5)
+    taps = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-(taps**2) / (2 * sigma**2))
+    kernel /= kernel.sum()
+
+    step = np.zeros(length + 2 * radius, np.float32)
+    step[start + radius : end + radius] = 1.0
+    return np.convolve(step, kernel, mode="valid")
+
+
+@functools.lru_cache(maxsize=None)
+def load_title_font(size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """Load the first available title font, cached per process."""
+    for font_path in TITLE_FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def create_corner_tile(radius: int) -> Image.Image:
+    """Create an anti-aliased top-left quarter-circle mask of radius x radius.
+
+    Only this small tile is supersampled; full-size rounded masks are assembled
+    from it so the AA cost no longer scales with the canvas.
+    """
+    scale = SUPERSAMPLE_SCALE
+    hi_radius = radius * scale
+    hi_tile = Image.new("L", (hi_radius, hi_radius), 0)
+    ImageDraw.Draw(hi_tile).ellipse((0, 0, hi_radius * 2, hi_radius * 2), fill=255)
+    return hi_tile.resize((radius, radius), Image.Resampling.BILINEAR)
+
+
+def create_rounded_mask(
+    size: tuple[int, int],
+    corner_radius: int,
+    top: bool = True,
+    bottom: bool = True,
+) -> Image.Image:
+    """Create an L-mode mask of the given size with anti-aliased rounded corners.
+
+    The radius is capped at half the mask's width and height, like Pillow's
+    ``rounded_rectangle``.
+    """
+    width, height = size
+    mask = Image.new("L", size, 255)
+    radius = min(corner_radius, width // 2, height // 2)
+    if radius <= 0:
+        return mask
+
+    corner = create_corner_tile(radius)
+    if top:
+        mask.paste(corner, (0, 0))
+        mask.paste(corner.transpose(Image.Transpose.FLIP_LEFT_RIGHT), (width - radius, 0))
+    if bottom:
+        mask.paste(corner.transpose(Image.Transpose.FLIP_TOP_BOTTOM), (0, height - radius))
+        mask.paste(
+            corner.transpose(Image.Transpose.ROTATE_180),
+            (width - radius, height - radius),
+        )
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def create_button(color: tuple[int, int, int]) -> Image.Image:
+    """Create an anti-aliased traffic light button sprite."""
+    scale = SUPERSAMPLE_SCALE
+    size = BUTTON_RADIUS * 2
+    hi_size = size * scale
+    hi_button = Image.new("RGBA", (hi_size, hi_size), color + (0,))
+    ImageDraw.Draw(hi_button).ellipse(
+        (0, 0, hi_size - 1, hi_size - 1), fill=color + (255,)
+    )
+    return hi_button.resize((size, size), Image.Resampling.BILINEAR)
+
+
+@functools.lru_cache(maxsize=32)
 def create_title_bar_supersampled(
     width: int,
     height: int,
-    corner_radius: int,
     title: str | None = None,
 ) -> Image.Image:
-    """Create an anti-aliased title bar using supersampling.
+    """Create an anti-aliased rectangular title bar.
 
-    Renders at higher resolution then downscales for smooth edges.
+    Drawn at final resolution; only the buttons are supersampled, as small
+    sprites. Corner rounding is applied later with the frame mask. The result
+    is cached and shared between calls, so callers must not mutate it.
     """
-    scale = SUPERSAMPLE_SCALE
-    hi_width = width * scale
-    hi_height = height * scale
-    hi_radius = corner_radius * scale
-    hi_button_radius = BUTTON_RADIUS * scale
-    hi_button_spacing = BUTTON_SPACING * scale
-    hi_button_margin = BUTTON_LEFT_MARGIN * scale
-
-    # Create high-res title bar
-    title_bar = Image.new("RGBA", (hi_width, hi_height), (0, 0, 0, 0))
+    title_bar = Image.new("RGBA", (width, height), TITLE_BAR_FILL)
     draw = ImageDraw.Draw(title_bar)
 
-    # Draw rounded rectangle for title bar (rounded top, square bottom)
-    draw.rounded_rectangle(
-        (0, 0, hi_width, hi_height),
-        radius=hi_radius,
-        fill=TITLE_BAR_COLOR + (255,),
-    )
-    # Square off the bottom corners
-    draw.rectangle(
-        (0, hi_height - hi_radius, hi_width, hi_height),
-        fill=TITLE_BAR_COLOR + (255,),
-    )
-
     # Draw traffic light buttons
-    button_y = hi_height // 2
-    for i, color in enumerate(BUTTON_COLORS):
-        button_x = hi_button_margin + i * (hi_button_radius * 2 + hi_button_spacing)
-        rgb = hex_to_rgb(color)
-        draw.ellipse(
-            (
-                button_x - hi_button_radius,
-                button_y - hi_button_radius,
-                button_x + hi_button_radius,
-                button_y + hi_button_radius,
-            ),
-            fill=rgb,
+    button_y = height // 2
+    for i, color in enumerate(BUTTON_COLORS_RGB):
+        button_x = BUTTON_LEFT_MARGIN + i * (BUTTON_RADIUS * 2 + BUTTON_SPACING)
+        button = create_button(color)
+        title_bar.paste(
+            button, (button_x - BUTTON_RADIUS, button_y - BUTTON_RADIUS), button
         )
 
     # Draw title text if provided
     if title:
-        try:
-            font = ImageFont.truetype(
-                "/System/Library/Fonts/SF-Pro-Text-Medium.otf", 13 * scale
-            )
-        except OSError:
-            try:
-                font = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", 13 * scale
-                )
-            except OSError:
-                font = ImageFont.load_default()
-
+        font = load_title_font(TITLE_FONT_SIZE)
         text_bbox = draw.textbbox((0, 0), title, font=font)
         text_width = text_bbox[2] - text_bbox[0]
         text_height = text_bbox[3] - text_bbox[1]
-        text_x = (hi_width - text_width) // 2
-        text_y = (hi_height - text_height) // 2
+        text_x = (width - text_width) // 2
+        text_y = (height - text_height) // 2
         draw.text((text_x, text_y), title, fill=(80, 80, 80), font=font)
 
     # Draw bottom border line
-    draw.line((0, hi_height - scale, hi_width, hi_height - scale), fill=BORDER_COLOR, width=scale)
+    draw.line((0, height - 1, width, height - 1), fill=BORDER_COLOR)
+    return title_bar
 
-    # Downscale with high-quality resampling
-    return title_bar.resize((width, height), Image.Resampling.LANCZOS)
 
+@dataclass(frozen=True)
+class _FrameTemplate:
+    """A pre-rendered frame, shared by every source image of the same size."""
 
-def create_browser_frame(
-    image_path: Path,
-    output_path: Path,
-    title: str | None = None,
-    shadow: bool = True,
-    corner_radius: int = CORNER_RADIUS,
-) -> Path:
-    """Add a macOS-style browser frame to an image.
+    frame: Image.Image  # Shadow and title bar, already rounded
+    corner_mask: Image.Image | None  # Bottom band of the content mask, if rounded
+    content_position: tuple[int, int]
 
-    Args:
-        image_path: Path to the input image
-        output_path: Path for the output image
-        title: Optional title text for the title bar
-        shadow: Whether to add a drop shadow
-        corner_radius: Radius for rounded corners
 
-    Returns:
-        Path to the created output file
-    """
-    # Load the source image
-    source = Image.open(image_path).convert("RGBA")
-    src_width, src_height = source.size
+# Each worker task frames images of a single size, so one entry is enough;
+# a template holds full-canvas RGBA frames (~22 MB for a retina capture).
+@functools.lru_cache(maxsize=1)
+def _build_frame_template(
+    src_width: int,
+    src_height: int,
+    title: str | None,
+    shadow: bool,
+    corner_radius: int,
+) -> _FrameTemplate:
+    """Render everything except the source pixels for a given source size.
 
+    The template is cached and shared between calls, so callers must copy
+    ``frame`` before drawing into it.
+    """
     # Calculate dimensions
     frame_width = src_width
     frame_height = src_height + TITLE_BAR_HEIGHT
@@ -167,121 +236,168 @@ def create_browser_frame(
         offset_x = 0
         offset_y = 0
 
-    # Create the final canvas with transparency
-    final = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
     shadow_canvas: Image.Image | None = None
 
-    # Create shadow if enabled (using supersampling for smooth edges)
+    # Create shadow if enabled. A blurred rectangle is the outer product of two
+    # blurred 1D steps, so while the corners are small next to the blur (error
+    # under 5/255) the blur is computed separably on the edges only. Larger
+    # radii visibly round the shadow, so the real rounded shape is blurred.
     if shadow:
-        scale = SUPERSAMPLE_SCALE
-        hi_canvas = Image.new(
-            "RGBA", (canvas_width * scale, canvas_height * scale), (0, 0, 0, 0)
-        )
-        hi_draw = ImageDraw.Draw(hi_canvas)
-
-        shadow_rect = (
-            (offset_x + SHADOW_OFFSET) * scale,
-            (offset_y + SHADOW_OFFSET) * scale,
-            (offset_x + frame_width + SHADOW_OFFSET) * scale,
-            (offset_y + frame_height + SHADOW_OFFSET) * scale,
-        )
-        hi_draw.rounded_rectangle(
-            shadow_rect, radius=corner_radius * scale, fill=SHADOW_COLOR
-        )
+        shadow_x = offset_x + SHADOW_OFFSET
+        shadow_y = offset_y + SHADOW_OFFSET
+        if corner_radius <= SHADOW_BLUR:
+            alpha = np.outer(
+                blur_step(canvas_height, shadow_y, shadow_y + frame_height, SHADOW_BLUR),
+                blur_step(canvas_width, shadow_x, shadow_x + frame_width, SHADOW_BLUR),
+            )
+            alpha *= SHADOW_COLOR[3]
+            shadow_alpha = Image.fromarray(np.rint(alpha).astype(np.uint8), "L")
+        else:
+            shadow_alpha = Image.new("L", (canvas_width, canvas_height), 0)
+            shadow_alpha.paste(
+                SHADOW_COLOR[3],
+                (shadow_x, shadow_y),
+                create_rounded_mask((frame_width, frame_height), corner_radius),
+            )
+            shadow_alpha = shadow_alpha.filter(ImageFilter.GaussianBlur(SHADOW_BLUR))
 
-        # Downscale then blur
-        shadow_canvas = hi_canvas.resize(
-            (canvas_width, canvas_height), Image.Resampling.LANCZOS
+        shadow_canvas = Image.new(
+            "RGBA", (canvas_width, canvas_height), SHADOW_COLOR[:3] + (0,)
         )
-        shadow_canvas = shadow_canvas.filter(ImageFilter.GaussianBlur(SHADOW_BLUR))
-        final = Image.alpha_composite(final, shadow_canvas)
-
-    # Create the white content background with rounded corners (supersampled)
-    scale = SUPERSAMPLE_SCALE
-    hi_bg = Image.new(
-        "RGBA", (canvas_width * scale, canvas_height * scale), (0, 0, 0, 0)
+        shadow_canvas.putalpha(shadow_alpha)
+
+    # Round the title bar's top corners and the content's bottom corners. The
+    # opaque title bar and the source cover the frame between them, so no
+    # separate background layer is needed. Like the title bar mask itself, its
+    # rounding is capped at half the bar height so large radii never clip the
+    # traffic light buttons.
+    title_bar = create_title_bar_supersampled(frame_width, TITLE_BAR_HEIGHT, title).copy()
+    title_bar.putalpha(
+        create_rounded_mask((frame_width, TITLE_BAR_HEIGHT), corner_radius, bottom=False)
     )
-    hi_bg_draw = ImageDraw.Draw(hi_bg)
 
-    frame_rect_hi = (
-        offset_x * scale,
-        offset_y * scale,
-        (offset_x + frame_width) * scale,
-        (offset_y + frame_height) * scale,
-    )
-    hi_bg_draw.rounded_rectangle(
-        frame_rect_hi, radius=corner_radius * scale, fill=(255, 255, 255, 255)
-    )
-
-    bg_layer = hi_bg.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-    final = Image.alpha_composite(final, bg_layer)
-
-    # Create anti-aliased title bar
-    title_bar = create_title_bar_supersampled(
-        frame_width, TITLE_BAR_HEIGHT, corner_radius, title
-    )
-
-    # Paste title bar
-    final.paste(title_bar, (offset_x, offset_y), title_bar)
+    # Above the bottom corners the content mask is fully opaque, so only keep
+    # the bottom band that actually rounds anything
+    corner_mask: Image.Image | None = None
+    if corner_radius > 0:
+        band_height = min(corner_radius, src_height)
+        corner_mask = create_rounded_mask(
+            (frame_width, src_height), corner_radius, top=False
+        ).crop((0, src_height - band_height, frame_width, src_height))
+
+    # Composite the title bar over the shadow in place, touching only its box
+    if shadow_canvas is not None:
+        frame = shadow_canvas
+    else:
+        frame = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
+    frame.alpha_composite(title_bar, (offset_x, offset_y))
 
-    # Paste the source image into the content area
     content_position = (offset_x, offset_y + TITLE_BAR_HEIGHT)
-    final.paste(source, content_position)
 
-    # Create rounded corner mask for bottom of content (supersampled)
-    hi_mask = Image.new("L", (canvas_width * scale, canvas_height * scale), 0)
-    hi_mask_draw = ImageDraw.Draw(hi_mask)
-
-    content_rect_hi = (
-        offset_x * scale,
-        (offset_y + TITLE_BAR_HEIGHT) * scale,
-        (offset_x + frame_width) * scale,
-        (offset_y + frame_height) * scale,
-    )
-    hi_mask_draw.rounded_rectangle(
-        content_rect_hi, radius=corner_radius * scale, fill=255
-    )
-    # Square off the top
-    hi_mask_draw.rectangle(
-        (
-            offset_x * scale,
-            (offset_y + TITLE_BAR_HEIGHT) * scale,
-            (offset_x + frame_width) * scale,
-            (offset_y + TITLE_BAR_HEIGHT + corner_radius) * scale,
-        ),
-        fill=255,
+    return _FrameTemplate(
+        frame=frame,
+        corner_mask=corner_mask,
+        content_position=content_position,
     )
 
-    content_mask = hi_mask.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
 
-    # Apply rounded corners to content
-    content_layer = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
-    content_layer.paste(source, content_position)
+def create_browser_frame(
+    image: Image.Image | Path,
+    output_path: Path,
+    title: str | None = None,
+    shadow: bool = True,
+    corner_radius: int = CORNER_RADIUS,
+    png_level: int = PNG_COMPRESS_LEVEL,
+    optimize: bool = False,
+) -> Path:
+    """Add a macOS-style browser frame to an image.
 
-    # Composite with mask
-    final_with_content = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
+    Args:
+        image: Path to the input image, or an already opened (possibly lazy)
+            Image, which is left unmodified
+        output_path: Path for the output image
+        title: Optional title text for the title bar
+        shadow: Whether to add a drop shadow
+        corner_radius: Radius for rounded corners
+        png_level: zlib compression level (0-9) for the PNG output
+        optimize: Re-compress the saved PNG with oxipng (requires pyoxipng)
 
-    # Re-add shadow
-    if shadow and shadow_canvas is not None:
-        final_with_content = Image.alpha_composite(final_with_content, shadow_canvas)
+    Returns:
+        Path to the created output file
+    """
+    if optimize:
+        require_oxipng()
 
-    # Add background
-    final_with_content = Image.alpha_composite(final_with_content, bg_layer)
+    # Load the source image, only converting (and copying) it if needed. The
+    # source is only read from below, so a caller's image is never modified.
+    if isinstance(image, Image.Image):
+        source = image
+    else:
+        with Image.open(image) as source:
+            source.load()
+    if source.mode != "RGBA":
+        source = source.convert("RGBA")
 
-    # Add title bar
-    title_bar_layer = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
-    title_bar_layer.paste(title_bar, (offset_x, offset_y), title_bar)
-    final_with_content = Image.alpha_composite(final_with_content, title_bar_layer)
+    # Only the source pixels differ between images of the same size
+    src_width, src_height = source.size
+    template = _build_frame_template(src_width, src_height, title, shadow, corner_radius)
+    content_x, content_y = template.content_position
+    final = template.frame.copy()
+
+    # The source replaces what lies beneath it, so transparent source pixels
+    # (e.g. the margins of a macOS window capture) stay transparent
+    final.paste(source, template.content_position)
+
+    if template.corner_mask is not None:
+        # Round the bottom corners by interpolating between the source and the
+        # template in premultiplied space; only the narrow bottom band is touched
+        band_top = src_height - template.corner_mask.height
+        band_position = (content_x, content_y + band_top)
+        band_box = band_position + (content_x + src_width, content_y + src_height)
+        band = template.frame.crop(band_box).convert("RGBa")
+        band.paste(
+            source.crop((0, band_top, src_width, src_height)).convert("RGBa"),
+            (0, 0),
+            template.corner_mask,
+        )
+        final.paste(band.convert("RGBA"), band_position)
 
-    # Add content with mask
-    final_with_content.paste(content_layer, (0, 0), content_mask)
+    # Without shadow or rounded corners an opaque source gives a fully opaque
+    # frame, so drop alpha
+    if not shadow and corner_radius == 0 and source.getextrema()[3][0] == 255:
+        final = final.convert("RGB")
 
     # Save the result
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    final_with_content.save(output_path, "PNG")
+    final.save(output_path, "PNG", compress_level=png_level, optimize=False)
+    if optimize:
+        oxipng.optimize(str(output_path), level=OXIPNG_LEVEL)
     return output_path
 
 
+def _worker(
+    jobs: list[tuple[Path, Path]],
+    title: str | None,
+    shadow: bool,
+    corner_radius: int,
+    png_level: int,
+    optimize: bool,
+) -> list[Path]:
+    """Frame a chunk of same-size images in a worker process."""
+    return [
+        create_browser_frame(
+            img_path,
+            output_file,
+            title=title,
+            shadow=shadow,
+            corner_radius=corner_radius,
+            png_level=png_level,
+            optimize=optimize,
+        )
+        for img_path, output_file in jobs
+    ]
+
+
 def process_batch(
     input_path: Path,
     output_path: Path,
@@ -289,6 +405,8 @@ def process_batch(
     shadow: bool = True,
     corner_radius: int = CORNER_RADIUS,
     keep_name: bool = False,
+    png_level: int = PNG_COMPRESS_LEVEL,
+    optimize: bool = False,
 ) -> list[Path]:
     """Process a single file or all images in a directory.
 
@@ -298,10 +416,15 @@ def process_batch(
         title: Optional title for the title bar
         shadow: Whether to add drop shadows
         corner_radius: Radius for rounded corners
+        png_level: zlib compression level (0-9) for the PNG output
+        optimize: Re-compress each saved PNG with oxipng (requires pyoxipng)
 
     Returns:
         List of created output file paths
     """
+    if optimize:
+        require_oxipng()
+
     image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif"}
     created_files = []
 
@@ -314,7 +437,13 @@ def process_batch(
             output_file = output_path
 
         result = create_browser_frame(
-            input_path, output_file, title=title, shadow=shadow, corner_radius=corner_radius
+            input_path,
+            output_file,
+            title=title,
+            shadow=shadow,
+            corner_radius=corner_radius,
+            png_level=png_level,
+            optimize=optimize,
         )
         created_files.append(result)
         print(f"Created: {result}")
@@ -324,18 +453,54 @@ def process_batch(
         output_path.mkdir(parents=True, exist_ok=True)
         suffix = "" if keep_name else "_framed"
 
-        for img_path in sorted(input_path.iterdir()):
-            if img_path.suffix.lower() in image_extensions:
-                output_file = output_path / f"{img_path.stem}{suffix}.png"
-                result = create_browser_frame(
-                    img_path,
-                    output_file,
-                    title=title,
-                    shadow=shadow,
-                    corner_radius=corner_radius,
+        jobs = [
+            (img_path, output_path / f"{img_path.stem}{suffix}.png")
+            for img_path in sorted(input_path.iterdir())
+            if img_path.suffix.lower() in image_extensions
+        ]
+
+        # Group same-size screenshots so each task reuses one cached template.
+        # Image.open is lazy, so this only reads each file's header.
+        groups: dict[tuple[int, int], list[tuple[Path, Path]]] = {}
+        for img_path, output_file in jobs:
+            with Image.open(img_path) as image:
+                size = image.size
+            groups.setdefault(size, []).append((img_path, output_file))
+
+        # Split large groups into chunks so a directory of identical
+        # screenshots still spreads across every worker
+        max_workers = os.cpu_count() or 1
+        chunk_size = max(1, -(-len(jobs) // max_workers))
+        chunks = [
+            group[i : i + chunk_size]
+            for group in groups.values()
+            for i in range(0, len(group), chunk_size)
+        ]
+
+        # Chunks are independent, so frame them in parallel across processes
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _worker,
+                    chunk,
+                    title,
+                    shadow,
+                    corner_radius,
+                    png_level,
+                    optimize,
                 )
-                created_files.append(result)
-                print(f"Created: {result}")
+                for chunk in chunks
+            ]
+            try:
+                for future in as_completed(futures):
+                    for result in future.result():
+                        print(f"Created: {result}")
+            except BaseException:
+                # Stop on the first failure instead of framing the rest
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        created_files.extend(output_file for _, output_file in jobs)
 
     else:
         print(f"Error: {input_path} does not exist", file=sys.stderr)
@@ -367,24 +532,46 @@ Examples:
         "--radius",
         type=int,
         default=CORNER_RADIUS,
-        help=f"Corner radius in pixels (default: {CORNER_RADIUS})",
+        help=(
+            f"Corner radius in pixels (default: {CORNER_RADIUS}); title bar "
+            f"corners are capped at {TITLE_BAR_HEIGHT // 2}"
+        ),
     )
     parser.add_argument(
         "--keep-name",
         action="store_true",
         help="Keep original filename without adding '_framed' suffix",
     )
+    parser.add_argument(
+        "--png-level",
+        type=int,
+        choices=range(10),
+        default=PNG_COMPRESS_LEVEL,
+        metavar="N",
+        help=f"PNG compression level 0-9 (default: {PNG_COMPRESS_LEVEL})",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Re-compress output with oxipng for smaller files (requires pyoxipng)",
+    )
 
     args = parser.parse_args()
 
-    created = process_batch(
-        args.input,
-        args.output,
-        title=args.title,
-        shadow=not args.no_shadow,
-        corner_radius=args.radius,
-        keep_name=args.keep_name,
-    )
+    try:
+        created = process_batch(
+            args.input,
+            args.output,
+            title=args.title,
+            shadow=not args.no_shadow,
+            corner_radius=args.radius,
+            keep_name=args.keep_name,
+            png_level=args.png_level,
+            optimize=args.optimize,
+        )
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
     print(f"\nProcessed {len(created)} image(s)")
 